@@ -26,8 +26,8 @@ def last(n: int, sequence: Sequence[Any]) -> Sequence[Any]: return [] if sequenc
 def ensure_integral(value: int) -> int:
     if isinstance(value, int):
         return value
-    elif hasattr(val, '__index__'):
-        return val.__index__()
+    elif hasattr(value, '__index__'):
+        return value.__index__()
     else:
         raise TypeError(':[%s]: Input is not an integral type.' % str(value))
 
@@ -67,7 +67,7 @@ def ensure_in_natural(value: int, zero_inclusive: bool = True):
     if n_value >= (0 if zero_inclusive else 1):
         return n_value
     else:
-        raise ValueError(':[%d]: Input is less than %d.' % (0 if zero_inclusive else 1))
+        raise ValueError(':[%d]: Input is less than %d.' % (n_value, 0 if zero_inclusive else 1))
 
 
 #       Digit       #
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List
+
+import os
+import sys
+
+__all__ = ['batch_map', 'gil_enabled']
+
+def gil_enabled() -> bool:
+    """Whether or not the running interpreter has the GIL enabled.
+
+    True on builds before free-threading existed, or on a free-threaded build
+    that has re-enabled the GIL, e.g. with PYTHON_GIL=1.
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+def batch_map(f: Callable[[Any], Any], values: Iterable[Any], max_workers: int = None, parallel: bool = None) -> List[Any]:
+    """Applies `f` to each value on a thread pool, and returns the results in order.
+
+    The values are split into contiguous chunks, a few per worker, so the pool
+    overhead is paid per chunk rather than per value. Threads share memory, so
+    nothing is pickled, unlike with a process pool.
+
+    The `jukebox` transforms are pure Python and CPU bound, so threads only run
+    them in parallel on a free-threaded build. With the GIL enabled the values
+    are mapped serially in the calling thread unless `parallel` is True.
+
+    Args:
+        f: A thread-safe function to apply.
+        values: The values to apply `f` to.
+        max_workers: Optional maximum number of threads. The default is the
+            number of CPUs.
+        parallel: Optional flag. If True, a thread pool is always used. If
+            False, it never is. The default is to use one only when the GIL is
+            disabled.
+
+    Returns:
+        list: The result of `f` for each value, in the order of `values`.
+
+    """
+    n_values = list(values)
+    n_parallel = (not gil_enabled()) if parallel is None else parallel
+    workers = min(max_workers or os.cpu_count() or 1, len(n_values))
+
+    if not n_parallel or workers < 2:
+        return [f(value) for value in n_values]
+
+    size = -(-len(n_values) // (workers * 4))
+    chunks = [n_values[i:i + size] for i in range(0, len(n_values), size)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda chunk: [f(value) for value in chunk], chunks)
+        return [result for chunk in results for result in chunk]
@@ -0,0 +1,197 @@
+from array import array
+from jukebox.natural import Natural
+from jukebox.transforms import Transform
+from typing import Final, List, Optional, Sequence, Tuple
+
+import functools
+
+__all__ = ['BoundedSweep', 'MAX_SWEEP_SIZE', 'orbit_bound']
+
+MAX_SWEEP_SIZE: Final[int] = 1 << 24
+
+# The typecodes of the labels, narrowest first, with the largest label each holds.
+_LABEL_TYPECODES: Final[Tuple[Tuple[str, int]]] = (('b', 127), ('h', 32767), ('l', 2147483647))
+
+@functools.lru_cache(maxsize=None)
+def _orbit_bound(base: int, multiplier: int) -> Optional[int]:
+    if base >= 10:
+        return None
+
+    # g is the largest value of b^n * J_b(x) over k-digit x. It follows
+    # g(1) = 9 * b^n and g(k + 1) = b * g(k) + 9 * b^n. Once g(k) < 10^(k-1) and
+    # 9 * b^n <= (10 - b) * 10^(k-1), g stays below the smallest k-digit value
+    # for every larger k as well, so any x with k or more digits maps lower.
+    previous = 0
+    g = 9 * multiplier
+    k = 1
+
+    while not (g < 10 ** (k - 1) and 9 * multiplier <= (10 - base) * 10 ** (k - 1)):
+        previous = g
+        g = base * g + 9 * multiplier
+        k += 1
+
+    return max(10 ** (k - 1) - 1, previous)
+
+def orbit_bound(base: Natural, power: Natural = 1, transform: Transform = Transform.J) -> Optional[Natural]:
+    """The bound, M, of every orbit of a transform with a base less than 10.
+
+    For b < 10, f(x) < x once x has enough digits, so [0, M] is closed under f
+    and every orbit starting at x_0 stays within [0, max(x_0, M)]. Values above M
+    only occur in a strictly decreasing prefix of an orbit, so every cycle lies
+    in [0, M].
+
+    Args:
+        base: The base of the transform.
+        power: The power of the transform, if it is a `B_b(x)` transform.
+        transform: The transform. The default is `Transform.J`.
+
+    Returns:
+        Natural: The bound, M, or None if the base is 10 or more.
+
+    Raises:
+        TypeError: If `transform` is not a `Transform` option.
+
+    """
+    if not isinstance(transform, Transform):
+        raise TypeError(':[%s]: Input is not a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+
+    n_base = int(Natural.of(base))
+    n_power = int(Natural.of(power)) if transform == Transform.B else (0 if transform == Transform.J else 1)
+    bound = _orbit_bound(n_base, n_base ** n_power)
+
+    return Natural(bound) if bound is not None else None
+
+class BoundedSweep(object):
+    """A classification of every x_0 in [0, M] by the cycle its sequence ends in.
+
+    M is the `orbit_bound` of the transform, so the whole range is closed under
+    it and each orbit ends in a cycle. The result is a dense typed array, indexed
+    by x_0, of the position of the cycle in `cycles`. It starts with one byte per
+    value, and is only widened if there are more cycles than a byte can label.
+    Each value is transformed once, and the walk from a new value stops at the
+    first already classified one.
+    """
+
+    def __init__(self, base: Natural, power: Natural = 1, transform: Transform = Transform.J, max_size: int = MAX_SWEEP_SIZE):
+        """Initializes and runs the sweep for the `base` with optional `power`.
+
+        Args:
+            base: The base of the transform.
+            power: The power of the transform, if it is a `B_b(x)` transform.
+            transform: The transform. The default is `Transform.J`.
+            max_size: The maximum number of values, M + 1, to sweep. The default
+                is 2^24.
+
+        Raises:
+            TypeError: If `transform` is not a `Transform` option.
+            ValueError: If the transform has no orbit bound, or it is above
+                `max_size`.
+
+        """
+        bound = orbit_bound(base, power, transform)
+
+        if bound is None:
+            raise ValueError(':[%d]: Base has no orbit bound. It must be less than 10.' % base)
+
+        if bound + 1 > max_size:
+            raise ValueError(':[%d]: Orbit bound is larger than the maximum sweep size of %d.' % (bound, max_size))
+
+        self.__base = Natural.of(base)
+        self.__bound = bound
+        self.__transform = transform
+        self.__power = Natural.of(power) if transform == Transform.B else (0 if transform == Transform.J else 1)
+        self.__cycles = tuple()
+        self.__labels = array('b')
+
+        self.__sweep()
+
+    @property
+    def base(self) -> Natural:
+        """The base of the transform."""
+        return self.__base
+
+    @property
+    def bound(self) -> Natural:
+        """The orbit bound, M, and largest x_0 in the sweep."""
+        return self.__bound
+
+    @property
+    def counts(self) -> List[int]:
+        """The number of x_0 in [0, M] that end in each cycle, in the order of `cycles`."""
+        counts = [0] * len(self.__cycles)
+
+        for label in self.__labels:
+            counts[label] += 1
+
+        return counts
+
+    @property
+    def cycles(self) -> Tuple[Tuple[Natural]]:
+        """Every cycle of the transform, in the order they were found."""
+        return self.__cycles
+
+    @property
+    def labels(self) -> Sequence[int]:
+        """A read-only view of the position in `cycles` of the cycle each x_0 ends in, indexed by x_0."""
+        return memoryview(self.__labels).toreadonly()
+
+    @property
+    def power(self) -> Natural:
+        """The power of the transform, if it is a `B_b(x)` transform."""
+        return self.__power
+
+    @property
+    def transform_name(self) -> str:
+        """The transform name of the sweep."""
+        return self.__transform.value[0]
+
+    def cycle_of(self, x_0: Natural) -> Tuple[Natural]:
+        """The cycle the sequence starting with `x_0` ends in.
+
+        Raises:
+            TypeError: If `x_0` is not an integral type.
+            ValueError: If `x_0` is negative.
+            IndexError: If `x_0` is greater than the bound.
+        """
+        return self.__cycles[self.__labels[Natural.of(x_0)]]
+
+    def __getitem__(self, x_0: int): return self.__labels[Natural.of(x_0)]
+
+    def __len__(self): return len(self.__labels)
+
+    def __sweep(self):
+        # -1 is unclassified, and -2 is on the walk in progress.
+        typecodes = iter(_LABEL_TYPECODES)
+        typecode, largest = next(typecodes)
+        labels = array(typecode, [-1]) * (self.__bound + 1)
+        cycles = []
+        f = self.__transform.value[1]
+        args = (self.__base, self.__power) if self.__transform == Transform.B else (self.__base,)
+
+        for x in range(self.__bound + 1):
+            if labels[x] != -1:
+                continue
+
+            walk = []
+            step = x
+
+            while labels[step] == -1:
+                labels[step] = -2
+                walk.append(step)
+                step = f(step, *args)
+
+            if labels[step] == -2:
+                label = len(cycles)
+                cycles.append(tuple(map(Natural.of, walk[walk.index(step):])))
+
+                if label > largest:
+                    typecode, largest = next(typecodes)
+                    labels = array(typecode, labels)
+            else:
+                label = labels[step]
+
+            for value in walk:
+                labels[value] = label
+
+        self.__cycles = tuple(cycles)
+        self.__labels = labels
@@ -1,7 +1,8 @@
+from jukebox.batches import batch_map
 from jukebox.natural import Natural
-from jukebox.sequences import DEFAULT_MAX_MU, TransformSequence, JSequence, KSequence, BSequence
+from jukebox.sequences import DEFAULT_MAX_MU, SharedTails, TransformSequence, JSequence, KSequence, BSequence
 from jukebox.transforms import Transform
-from typing import Callable
+from typing import Any, Callable, Iterable, List
 
 class TransformSequenceFactory(object):
     """A factory that makes it convenient to generate a `TransformSequence`.
@@ -11,9 +12,16 @@ class TransformSequenceFactory(object):
 
     The factory is callable taking in non-fixed values. The transform can be
     overwritten in the call
+
+    The fixed values are set once, when the factory is initialized, so a
+    factory can be shared across threads, and `batch` can call it from many.
+
+    Sequences made by the same factory share the tails of their orbits, such as
+    the common path into a cycle, unless `share_tails` is False. The shared
+    tails are kept for the life of the factory.
     """
 
-    def __init__(self, x_0_base_constant: Natural, transform_constant: Transform = None, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU):
+    def __init__(self, x_0_base_constant: Natural, transform_constant: Transform = None, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU, share_tails: bool = True):
         """Initializes the factory.
 
         Arguments:
@@ -27,11 +35,14 @@ class TransformSequenceFactory(object):
             max_mu: Maximum length of the sequence if a cycle isn't reached. The
                 default is 500.
 
+            share_tails: Optional flag. If True the sequences share common tails.
+                The default is True.
+
         """
         self._x_0_base = Natural.of(x_0_base_constant)
 
         if not (transform_constant is None or isinstance(transform_constant, Transform)):
-            raise TypeError(':[%s]: Input is not a `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+            raise TypeError(':[%s]: Input is not a `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform_constant))
 
         self.__transform = transform_constant
 
@@ -40,6 +51,7 @@ class TransformSequenceFactory(object):
 
         self._fix_iv = False if fix_x_0 is None else fix_x_0
         self._max_mu = Natural.of(max_mu)
+        self._tails = SharedTails() if share_tails else None
 
     @property
     def base(self):
@@ -73,11 +85,11 @@ class TransformSequenceFactory(object):
             raise TypeError(':[%s]: Factory does not have a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % transform)
         elif not self.__transform is None and not transform is None:
             if isinstance(transform, Transform):
-                print('WARNING: Input transform is: %s. Fixed transform is: %s. Factory will ignore the fixed and use the input transform.' % (transform[0], self.__transform.value[0]))
+                print('WARNING: Input transform is: %s. Fixed transform is: %s. Factory will ignore the fixed and use the input transform.' % (transform.value[0], self.__transform.value[0]))
             else:
                 print('WARNING: Input transform is not a valid `Transform` option. Factory will ignore the input value and use the fixed transform')
 
-        n_transform = transform if isinstance(transform, Transform) else self.__transform.value[1]
+        n_transform = transform if isinstance(transform, Transform) else self.__transform
 
         if not max_mu is None:
             try:
@@ -87,13 +99,24 @@ class TransformSequenceFactory(object):
         else:
             n_max_mu = self._max_mu
 
-        return TransformSequence(n_iv, n_base, power, n_transform, n_max_mu)
+        return TransformSequence(n_iv, n_base, power, n_transform, n_max_mu, self._tails)
+
+    def batch(self, x_0_bases: Iterable[Natural], *args: Any, max_workers: int = None, parallel: bool = None, **kwargs: Any) -> List[TransformSequence]:
+        """Calls the factory with each non-fixed value, in order, on a thread pool.
+
+        Any other arguments are passed through to each call. See
+        `jukebox.batches.batch_map` for when the calls run in parallel.
+
+        Returns:
+            list: The sequence for each value, in the order of `x_0_bases`.
+        """
+        return batch_map(lambda x_0_base: self(x_0_base, *args, **kwargs), x_0_bases, max_workers, parallel)
 
 class JSequenceFactory(TransformSequenceFactory):
     """The J_b(x) specific sequence factory."""
 
-    def __init__(self, x_0_base_constant, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU):
-        super().__init__(x_0_base_constant, Transform.J, fix_x_0, max_mu)
+    def __init__(self, x_0_base_constant, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU, share_tails: bool = True):
+        super().__init__(x_0_base_constant, Transform.J, fix_x_0, max_mu, share_tails)
 
     def __call__(self, x_0_base: Natural, max_mu: Natural = None):
         if self._fix_iv:
@@ -111,13 +134,13 @@ class JSequenceFactory(TransformSequenceFactory):
         else:
             n_max_mu = self._max_mu
 
-        return JSequence(n_iv, n_base, n_max_mu)
+        return JSequence(n_iv, n_base, n_max_mu, self._tails)
 
 class KSequenceFactory(TransformSequenceFactory):
     """The K_b(x) specific sequence factory."""
 
-    def __init__(self, x_0_base_constant, fix_x_0: bool = False, max_mu: Natural = None):
-        super().__init__(x_0_base_constant, Transform.K, fix_x_0, max_mu)
+    def __init__(self, x_0_base_constant, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU, share_tails: bool = True):
+        super().__init__(x_0_base_constant, Transform.K, fix_x_0, max_mu, share_tails)
 
     def __call__(self, x_0_base: Natural, max_mu: Natural = None):
         if self._fix_iv:
@@ -135,13 +158,13 @@ class KSequenceFactory(TransformSequenceFactory):
         else:
             n_max_mu = self._max_mu
 
-        return KSequence(n_iv, n_base, n_max_mu)
+        return KSequence(n_iv, n_base, n_max_mu, self._tails)
 
 class BSequenceFactory(TransformSequenceFactory):
     """The B_b(x) specific sequence factory."""
 
-    def __init__(self, x_0_base_constant, power: Natural = None, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU):
-        super().__init__(x_0_base_constant, Transform.B, fix_x_0, max_mu)
+    def __init__(self, x_0_base_constant, power: Natural = None, fix_x_0: bool = False, max_mu: Natural = DEFAULT_MAX_MU, share_tails: bool = True):
+        super().__init__(x_0_base_constant, Transform.B, fix_x_0, max_mu, share_tails)
         self.__power = Natural.of(power) if not power is None else None
 
     def __call__(self, x_0_base: Natural, power: Natural = None, max_mu: Natural = None):
@@ -162,8 +185,8 @@ class BSequenceFactory(TransformSequenceFactory):
 
         if not self.__power is None:
             if power is None:
-                return BSequence(n_iv, n_base, self.__power, n_max_mu)
+                return BSequence(n_iv, n_base, self.__power, n_max_mu, self._tails)
             else:
-                return BSequence(n_iv, n_base, power, n_max_mu)
+                return BSequence(n_iv, n_base, power, n_max_mu, self._tails)
         else:
-            return BSequence(n_iv, n_base, power, n_max_mu)
+            return BSequence(n_iv, n_base, power, n_max_mu, self._tails)
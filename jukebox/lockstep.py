@@ -0,0 +1,242 @@
+from jukebox.natural import Natural
+from jukebox.sequences import DEFAULT_MAX_MU
+from jukebox.transforms import Transform
+from typing import Iterable, List, NamedTuple, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['LaneResult', 'lockstep']
+
+# Lanes stay in int64 while every value is below this, leaving room for the
+# error of the float64 overflow check.
+_LANE_LIMIT = 1 << 62
+
+class LaneResult(NamedTuple):
+    """The summary of the sequence of one lane, as a `TransformSequence` would report it."""
+    x_0: int
+    base: int
+    mu: int
+    lambda_: int
+    x_mu: int
+    x_lambda: int
+
+def _step(values, bases, multipliers):
+    """Applies b^n * J_b(x) to every lane, and flags the lanes that overflow int64."""
+    results = numpy.zeros_like(values)
+    places = numpy.ones_like(values)
+    estimates = numpy.zeros(values.shape, dtype=numpy.float64)
+    float_places = numpy.ones(values.shape, dtype=numpy.float64)
+    remaining = values.copy()
+
+    # Wrapped int64 places and infinite float places are expected, and are
+    # either unused or flagged below.
+    with numpy.errstate(over='ignore', invalid='ignore'):
+        active = remaining > 0
+
+        while active.any():
+            remaining, digits = numpy.divmod(remaining, 10)
+            results += digits * places
+
+            # A place is only used while a higher digit remains, so it is no
+            # larger than the result, and only a discarded final place can wrap.
+            # Finished lanes keep their float place, so it can't become 0 * inf.
+            estimates = numpy.where(active, estimates + digits * float_places, estimates)
+            places *= bases
+            float_places = numpy.where(active, float_places * bases, float_places)
+            active = remaining > 0
+
+        results = results * multipliers
+        estimates = estimates * multipliers
+        overflowed = ~numpy.isfinite(estimates) | (estimates >= _LANE_LIMIT) | (results < 0)
+
+    return results, overflowed
+
+def _scalar(x_0: int, base: int, multiplier: int, max_mu: int) -> LaneResult:
+    """The search for one lane with Python integers, stepping as a `TransformSequence` does."""
+    def f(value: int) -> int:
+        digits = []
+        result = 0
+
+        while value > 0:
+            value, digit = divmod(value, 10)
+            digits.append(digit)
+
+        for digit in reversed(digits):
+            result = result * base + digit
+
+        return result * multiplier
+
+    # The position of each value seen. Unlike the lanes, a value can grow
+    # without bound here, so it never steps past the maximum mu.
+    seen = {}
+    step = previous = x_0
+
+    while step not in seen and len(seen) < max_mu:
+        seen[step] = len(seen)
+        previous = step
+        step = f(step)
+
+    if step in seen:
+        return LaneResult(x_0, base, seen[step], len(seen) - seen[step], step, previous)
+
+    return LaneResult(x_0, base, max_mu, 0, -1, -1)
+
+def _find_lambdas(x_0s, bases, multipliers, max_steps: int):
+    """Brent's search for the length of each cycle, with every lane stepping at once.
+
+    A cycle within the maximum mu is found well within `max_steps`, which is
+    4 times the maximum mu.
+
+    Returns the cycle length of each lane, 0 if it took more than `max_steps`,
+    or -1 if it overflowed int64.
+    """
+    lambdas = numpy.zeros(x_0s.shape, dtype=numpy.int64)
+    lanes = numpy.arange(x_0s.size)
+    tortoises = x_0s.copy()
+    hares, overflowed = _step(tortoises, bases, multipliers)
+    powers = numpy.ones_like(lanes)
+    lengths = numpy.ones_like(lanes)
+    steps = 1
+
+    while lanes.size:
+        found = tortoises == hares
+        lambdas[lanes[found]] = lengths[found]
+        lambdas[lanes[overflowed]] = -1
+
+        keep = ~(found | overflowed)
+
+        if steps >= max_steps or not keep.all():
+            lanes, tortoises, hares, bases, multipliers, powers, lengths = (a[keep] for a in (lanes, tortoises, hares, bases, multipliers, powers, lengths))
+
+            if steps >= max_steps:
+                break
+
+        reset = powers == lengths
+        tortoises = numpy.where(reset, hares, tortoises)
+        powers = numpy.where(reset, powers * 2, powers)
+        lengths = numpy.where(reset, 0, lengths)
+
+        hares, overflowed = _step(hares, bases, multipliers)
+        lengths += 1
+        steps += 1
+
+    return lambdas
+
+def _find_mus(x_0s, bases, multipliers, lambdas, max_mu: int):
+    """The path length, first cycle value, and last cycle value, of each lane with a known cycle length.
+
+    The hare starts lambda steps ahead of the tortoise, so they first meet at
+    x_mu, with the hare's previous value x_lambda. A lane whose path runs past
+    the maximum mu is retired with a mu of -1.
+    """
+    mus = numpy.zeros_like(x_0s)
+    x_mus = x_0s.copy()
+    x_lambdas = x_0s.copy()
+
+    lanes = numpy.arange(x_0s.size)
+    hares = x_0s.copy()
+    remaining = lambdas.copy()
+
+    while lanes.size:
+        x_lambdas[lanes] = hares
+        hares = _step(hares, bases[lanes], multipliers[lanes])[0]
+        remaining[lanes] -= 1
+
+        moving = remaining[lanes] > 0
+        x_mus[lanes[~moving]] = hares[~moving]
+        lanes, hares = lanes[moving], hares[moving]
+
+    # x_mus now holds each hare, lambda steps ahead.
+    lanes = numpy.arange(x_0s.size)
+    tortoises = x_0s.copy()
+    hares = x_mus.copy()
+    previous = x_lambdas.copy()
+    n_bases = bases.copy()
+    n_multipliers = multipliers.copy()
+
+    while lanes.size:
+        met = tortoises == hares
+        x_mus[lanes[met]] = tortoises[met]
+        x_lambdas[lanes[met]] = previous[met]
+
+        long = mus[lanes] + lambdas[lanes] > max_mu
+        mus[lanes[long]] = -1
+
+        keep = ~(met | long)
+        lanes, tortoises, hares, previous, n_bases, n_multipliers = (a[keep] for a in (lanes, tortoises, hares, previous, n_bases, n_multipliers))
+
+        previous = hares
+        tortoises = _step(tortoises, n_bases, n_multipliers)[0]
+        hares = _step(hares, n_bases, n_multipliers)[0]
+        mus[lanes] += 1
+
+    return mus, x_mus, x_lambdas
+
+def lockstep(lanes: Iterable[Tuple[Natural, Natural]], power: Natural = 1, transform: Transform = Transform.J, max_mu: Natural = DEFAULT_MAX_MU) -> List[LaneResult]:
+    """Finds the mu, lambda, x_mu, and x_lambda of the sequence of each (x_0, base) lane.
+
+    Every lane is stepped at once with numpy array operations, so the
+    interpreter overhead is paid per step rather than per lane and step. Each
+    lane finds its cycle with Brent's algorithm, which needs no record of the
+    values seen, and is retired from the arrays once it is done.
+
+    Lanes are held in int64. A lane with a value that would not fit is promoted
+    to a scalar search with Python integers. Without numpy, every lane is.
+
+    The results match those of a `TransformSequence` with the same arguments,
+    including a sequence that doesn't reach a cycle within the maximum mu.
+
+    Args:
+        lanes: The initial value and base of each sequence.
+        power: The power of the transform, if it is a `B_b(x)` transform.
+        transform: The transform. The default is `Transform.J`.
+        max_mu: Maximum length of each sequence if a cycle isn't reached. The
+            default is 500.
+
+    Returns:
+        list: The result of each lane, in the order of `lanes`.
+
+    Raises:
+        TypeError: If `transform` is not a `Transform` option.
+
+    """
+    if not isinstance(transform, Transform):
+        raise TypeError(':[%s]: Input is not a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+
+    n_lanes = [(int(Natural.of(x_0)), int(Natural.of(base))) for x_0, base in lanes]
+    n_power = int(Natural.of(power)) if transform == Transform.B else (0 if transform == Transform.J else 1)
+    n_max_mu = int(Natural.of(max_mu))
+    results = [None] * len(n_lanes)
+
+    if numpy is None:
+        return [_scalar(x_0, base, base ** n_power, n_max_mu) for x_0, base in n_lanes]
+
+    vector = [i for i, (x_0, base) in enumerate(n_lanes) if x_0 < _LANE_LIMIT and base < _LANE_LIMIT and base ** n_power < _LANE_LIMIT]
+    x_0s = numpy.array([n_lanes[i][0] for i in vector], dtype=numpy.int64)
+    bases = numpy.array([n_lanes[i][1] for i in vector], dtype=numpy.int64)
+    multipliers = numpy.array([n_lanes[i][1] ** n_power for i in vector], dtype=numpy.int64)
+
+    lambdas = _find_lambdas(x_0s, bases, multipliers, 4 * n_max_mu + 4)
+    cycled = numpy.flatnonzero(lambdas > 0)
+    mus, x_mus, x_lambdas = _find_mus(x_0s[cycled], bases[cycled], multipliers[cycled], lambdas[cycled], n_max_mu)
+
+    for j, i in enumerate(vector):
+        if lambdas[j] == 0:
+            results[i] = LaneResult(n_lanes[i][0], n_lanes[i][1], n_max_mu, 0, -1, -1)
+
+    for k, j in enumerate(cycled):
+        i = vector[j]
+
+        if mus[k] < 0:
+            results[i] = LaneResult(n_lanes[i][0], n_lanes[i][1], n_max_mu, 0, -1, -1)
+        else:
+            results[i] = LaneResult(n_lanes[i][0], n_lanes[i][1], int(mus[k]), int(lambdas[j]), int(x_mus[k]), int(x_lambdas[k]))
+
+    for i, result in enumerate(results):
+        if result is None:
+            results[i] = _scalar(n_lanes[i][0], n_lanes[i][1], n_lanes[i][1] ** n_power, n_max_mu)
+
+    return results
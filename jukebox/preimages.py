@@ -0,0 +1,215 @@
+from collections import deque
+from jukebox.natural import Natural
+from jukebox.transforms import Transform
+from typing import Dict, Iterator, Sequence
+
+__all__ = ['Basin', 'preimages']
+
+def _multiplier(base: int, power: int, transform: Transform) -> int:
+    """The factor, b ** n, separating a transform from J_b(x)."""
+    if transform == Transform.J:
+        return 1
+    elif transform == Transform.K:
+        return base
+    else:
+        return base ** power
+
+def _j_preimages(value: int, base: int, bound: int) -> Iterator[int]:
+    """All x <= bound, such that J_b(x) = value, by a digit-wise search.
+
+    The search relies on J_b(x) = x[0] + b * J_b(x // 10). Starting from the
+    lowest digit, each candidate digit must leave a remainder divisible by the
+    base, which is then the J_b(x) target for the next digit. A branch is pruned
+    once its partial value exceeds the bound, or its remainder exceeds the most
+    that the digits left under the bound can sum to.
+    """
+    if base == 0:
+        # J_0(x) = x[0], and the remaining digits are free.
+        if value <= 9:
+            yield from range(value, bound + 1, 10)
+        return
+
+    width = len(str(bound))
+    capacity = [0] * (width + 1)
+
+    for i in range(width - 1, -1, -1):
+        capacity[i] = 9 + base * capacity[i + 1]
+
+    stack = [(value, 0, 0, 1)]
+
+    while stack:
+        remainder, partial, position, place = stack.pop()
+
+        if remainder == 0:
+            yield partial
+            continue
+
+        if position >= width or remainder > capacity[position]:
+            continue
+
+        for digit in range(min(9, remainder), -1, -1):
+            if (remainder - digit) % base != 0:
+                continue
+
+            n_partial = partial + digit * place
+
+            if n_partial <= bound:
+                stack.append(((remainder - digit) // base, n_partial, position + 1, place * 10))
+
+def preimages(value: Natural, base: Natural, power: Natural = 1, transform: Transform = Transform.J, bound: Natural = None) -> Iterator[Natural]:
+    """Generates every x <= `bound`, such that f(x) = `value` for a transform f.
+
+    For b >= 2 the set of preimages is finite, so `bound` is optional. For b < 2
+    it is infinite, e.g. J_1(x) is the digit sum, and a bound is required.
+
+    The values are not generated in any particular order.
+
+    Args:
+        value: The value, y, whose preimages to find.
+        base: The base of the transform.
+        power: The power of the transform, if it is a `B_b(x)` transform.
+        transform: The transform. The default is `Transform.J`.
+        bound: Optional maximum value of a preimage.
+
+    Raises:
+        TypeError: If `transform` is not a `Transform` option.
+        ValueError: If `bound` is None and the base is less than 2.
+
+    """
+    n_value = Natural.of(value)
+    n_base = Natural.of(base)
+
+    if not isinstance(transform, Transform):
+        raise TypeError(':[%s]: Input is not a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+
+    if bound is None and n_base < 2:
+        raise ValueError(':[%d]: Base has infinitely many preimages. A bound is required.' % n_base)
+
+    multiplier = _multiplier(int(n_base), int(Natural.of(power)), transform)
+
+    if multiplier == 0:
+        # K_0(x) and B_0(x) with n > 0 map everything to 0.
+        if n_value == 0:
+            yield from map(Natural, range(int(Natural.of(bound)) + 1))
+        return
+
+    if n_value % multiplier != 0:
+        return
+
+    target = int(n_value) // multiplier
+
+    if bound is None:
+        # A k-digit x has J_b(x) >= b ** (k - 1), so a preimage has no more
+        # digits than the target has in base b.
+        width = 1
+
+        while n_base ** width <= target:
+            width += 1
+
+        n_bound = 10 ** width - 1
+    else:
+        n_bound = int(Natural.of(bound))
+
+    yield from map(Natural, _j_preimages(target, int(n_base), n_bound))
+
+class Basin(object):
+    """The basin of attraction of a cycle, up to a bound.
+
+    The basin is built backward from the cycle by a breadth-first search over
+    preimages, so the work scales with the size of the basin rather than the
+    range of initial values. Values above the bound are not followed, so a value
+    whose path to the cycle passes above the bound is not included.
+    """
+
+    def __init__(self, cycle: Sequence[Natural], base: Natural, bound: Natural, power: Natural = 1, transform: Transform = Transform.J):
+        """Initializes the basin of `cycle` with the `base` and optional `power`.
+
+        Args:
+            cycle: The values of a cycle of the transform, e.g. the `cycle` of a
+                `TransformSequence`, or a single fixed point.
+            base: The base of the transform.
+            bound: The maximum value in the basin.
+            power: The power of the transform, if it is a `B_b(x)` transform.
+            transform: The transform. The default is `Transform.J`.
+
+        Raises:
+            TypeError: If `transform` is not a `Transform` option.
+            ValueError: If `cycle` is empty.
+
+        """
+        if not isinstance(transform, Transform):
+            raise TypeError(':[%s]: Input is not a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+
+        self.__cycle = tuple(map(Natural.of, cycle if hasattr(cycle, '__iter__') else (cycle,)))
+
+        if len(self.__cycle) == 0:
+            raise ValueError(':[]: A basin requires a cycle with at least one value.')
+
+        self.__base = Natural.of(base)
+        self.__bound = Natural.of(bound)
+        self.__transform = transform
+        self.__power = Natural.of(power) if transform == Transform.B else (0 if transform == Transform.J else 1)
+        self.__depths = {}
+
+        self.__build()
+
+    @property
+    def base(self) -> Natural:
+        """The base of the transform."""
+        return self.__base
+
+    @property
+    def bound(self) -> Natural:
+        """The maximum value in the basin."""
+        return self.__bound
+
+    @property
+    def cycle(self) -> Sequence[Natural]:
+        """The cycle the basin flows into."""
+        return self.__cycle
+
+    @property
+    def depths(self) -> Dict[Natural, int]:
+        """A mapping of each value in the basin to its mu, or distance from the cycle."""
+        return dict(self.__depths)
+
+    @property
+    def power(self) -> Natural:
+        """The power of the transform, if it is a `B_b(x)` transform."""
+        return self.__power
+
+    @property
+    def transform_name(self) -> str:
+        """The transform name of the basin."""
+        return self.__transform.value[0]
+
+    def depth(self, value: Natural) -> int:
+        """The distance of `value` from the cycle.
+
+        Raises:
+            KeyError: If `value` is not in the basin.
+        """
+        return self.__depths[value]
+
+    def __contains__(self, value: Natural): return value in self.__depths
+
+    def __iter__(self):
+        for value in self.__depths:
+            yield value
+
+    def __len__(self): return len(self.__depths)
+
+    def __build(self):
+        depths = {value: 0 for value in self.__cycle if value <= self.__bound}
+        queue = deque(depths)
+
+        while queue:
+            value = queue.popleft()
+            depth = depths[value] + 1
+
+            for x in preimages(value, self.__base, self.__power, self.__transform, self.__bound):
+                if x not in depths:
+                    depths[x] = depth
+                    queue.append(x)
+
+        self.__depths = depths
@@ -0,0 +1,320 @@
+from jukebox.natural import Natural
+from jukebox.sequences import DEFAULT_MAX_MU, SharedTails, TransformSequence
+from jukebox.transforms import Transform
+from statistics import NormalDist
+from typing import Dict, List, NamedTuple, Tuple
+
+import math
+import random
+
+__all__ = ['Estimate', 'SampledSweep']
+
+class Estimate(NamedTuple):
+    """An estimate with its confidence interval, [low, high]."""
+    value: float
+    low: float
+    high: float
+
+    @property
+    def half_width(self) -> float:
+        """Half the width of the confidence interval."""
+        return (self.high - self.low) / 2
+
+class _Stratum(object):
+    """The running totals of the samples of initial values with the same number of digits."""
+
+    __slots__ = ('low', 'high', 'weight', 'n', 'counts', 'mu', 'mu_m2', 'mu_counts', 'lambda_', 'lambda_m2', 'lambda_counts')
+
+    def __init__(self, low: int, high: int, weight: float):
+        self.low = low
+        self.high = high
+        self.weight = weight
+        self.n = 0
+        self.counts = {}
+        self.mu = 0.0
+        self.mu_m2 = 0.0
+        self.mu_counts = {}
+        self.lambda_ = 0.0
+        self.lambda_m2 = 0.0
+        self.lambda_counts = {}
+
+    def add(self, cycle: Tuple[Natural], mu: int, lambda_: int):
+        # Welford's running mean and sum of squared deviations.
+        self.n += 1
+        self.counts[cycle] = self.counts.get(cycle, 0) + 1
+        self.mu_counts[mu] = self.mu_counts.get(mu, 0) + 1
+        self.lambda_counts[lambda_] = self.lambda_counts.get(lambda_, 0) + 1
+
+        delta = mu - self.mu
+        self.mu += delta / self.n
+        self.mu_m2 += delta * (mu - self.mu)
+
+        delta = lambda_ - self.lambda_
+        self.lambda_ += delta / self.n
+        self.lambda_m2 += delta * (lambda_ - self.lambda_)
+
+class SampledSweep(object):
+    """An estimate, from random samples, of how the sequences of a range of initial values end.
+
+    It estimates the distributions of the terminal cycles, mu, and lambda, and
+    the means of mu and lambda, for initial values in [low, high]. The range is stratified by
+    the number of digits, and samples are allocated to each stratum in
+    proportion to its size, with at least 2 each. The estimates are stratified
+    means, and their confidence intervals use the normal approximation.
+
+    Sampling stops once every interval is within its target precision, or the
+    maximum number of samples is reached. `precision` is the absolute half
+    width for each share, of a cycle or of a value of mu or lambda, and
+    `relative_precision` is the half width relative to the mean for the means
+    of mu and lambda.
+
+    A sequence that does not reach a cycle within the maximum mu is counted
+    under the empty cycle, (), with mu and lambda as the `TransformSequence`
+    reports them.
+    """
+
+    def __init__(self, low: Natural, high: Natural, base: Natural, power: Natural = 1, transform: Transform = Transform.J, seed: int = None, confidence: float = 0.95, precision: float = 0.01, relative_precision: float = 0.05, min_samples: int = 100, max_samples: int = 100000, examples: int = 3, max_mu: Natural = DEFAULT_MAX_MU):
+        """Initializes and runs the sweep of the initial values in [`low`, `high`].
+
+        Args:
+            low: The smallest initial value.
+            high: The largest initial value.
+            base: The base of the transform.
+            power: The power of the transform, if it is a `B_b(x)` transform.
+            transform: The transform. The default is `Transform.J`.
+            seed: Optional seed. The same seed gives the same samples.
+            confidence: The confidence level of the intervals. The default is
+                0.95.
+            precision: The target half width of the interval of each share.
+                The default is 0.01.
+            relative_precision: The target half width of the interval of each
+                mean, relative to the mean. The default is 0.05.
+            min_samples: The minimum number of samples before stopping. The
+                default is 100.
+            max_samples: The maximum number of samples. The default is 100000.
+            examples: The number of example sequences to keep for each cycle,
+                chosen uniformly from the samples. The default is 3.
+            max_mu: Maximum length of each sequence if a cycle isn't reached.
+                The default is 500.
+
+        Raises:
+            TypeError: If `transform` is not a `Transform` option.
+            ValueError: If `low` is greater than `high`, `confidence` is not in
+                (0, 1), `precision` or `relative_precision` is not positive,
+                `max_samples` is less than 2 for each stratum, or
+                `min_samples` is more than `max_samples`.
+
+        """
+        n_low = Natural.of(low)
+        n_high = Natural.of(high)
+
+        if n_low > n_high:
+            raise ValueError(':[%d, %d]: Input range is empty.' % (n_low, n_high))
+
+        if not 0 < confidence < 1:
+            raise ValueError(':[%s]: Confidence is not in the range of (0, 1).' % str(confidence))
+
+        if not precision > 0:
+            raise ValueError(':[%s]: Precision is not positive.' % str(precision))
+
+        if not relative_precision > 0:
+            raise ValueError(':[%s]: Relative precision is not positive.' % str(relative_precision))
+
+        n_strata = len(n_high) - len(n_low) + 1
+
+        if max_samples < 2 * n_strata:
+            raise ValueError(':[%d]: Maximum samples is less than %d, 2 for each of the %d strata.' % (max_samples, 2 * n_strata, n_strata))
+
+        if min_samples > max_samples:
+            raise ValueError(':[%d]: Minimum samples is more than the maximum of %d.' % (min_samples, max_samples))
+
+        if not isinstance(transform, Transform):
+            raise TypeError(':[%s]: Input is not a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+
+        self.__low = n_low
+        self.__high = n_high
+        self.__base = Natural.of(base)
+        self.__power = Natural.of(power)
+        self.__transform = transform
+        self.__random = random.Random(seed)
+        self.__z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.__precision = precision
+        self.__relative_precision = relative_precision
+        self.__min_samples = min_samples
+        self.__max_samples = max_samples
+        self.__max_mu = Natural.of(max_mu)
+        self.__tails = SharedTails()
+        self.__n_examples = examples
+        self.__examples = {}
+        self.__seen = {}
+        self.__strata = []
+        self.__n = 0
+        self.__converged = False
+
+        self.__sample()
+
+    @property
+    def base(self) -> Natural:
+        """The base of the transform."""
+        return self.__base
+
+    @property
+    def converged(self) -> bool:
+        """Whether or not every estimate reached the target precision before the maximum number of samples."""
+        return self.__converged
+
+    @property
+    def cycles(self) -> Dict[Tuple[Natural], Estimate]:
+        """The estimated share of the initial values that end in each cycle seen.
+
+        Each cycle starts with its smallest value.
+        """
+        return self.__shares(lambda s: s.counts, self.__seen)
+
+    @property
+    def examples(self) -> Dict[Tuple[Natural], List[TransformSequence]]:
+        """Example sequences that end in each cycle seen."""
+        return {cycle: list(sequences) for cycle, sequences in self.__examples.items()}
+
+    @property
+    def lambda_distribution(self) -> Dict[int, Estimate]:
+        """The estimated share of the initial values with each cycle length seen, shortest first."""
+        return self.__shares(lambda s: s.lambda_counts, sorted({l for s in self.__strata for l in s.lambda_counts}))
+
+    @property
+    def lambda_(self) -> Estimate:
+        """The estimated mean length of the cycle."""
+        return self.__estimate(lambda s: s.lambda_, lambda s: s.lambda_m2 / (s.n - 1))
+
+    @property
+    def mu_distribution(self) -> Dict[int, Estimate]:
+        """The estimated share of the initial values with each path length seen, shortest first."""
+        return self.__shares(lambda s: s.mu_counts, sorted({m for s in self.__strata for m in s.mu_counts}))
+
+    @property
+    def mu(self) -> Estimate:
+        """The estimated mean length of the path."""
+        return self.__estimate(lambda s: s.mu, lambda s: s.mu_m2 / (s.n - 1))
+
+    @property
+    def n(self) -> int:
+        """The number of samples."""
+        return self.__n
+
+    @property
+    def strata(self) -> List[Tuple[int, int, int]]:
+        """The smallest and largest initial value, and the number of samples, of each stratum."""
+        return [(s.low, s.high, s.n) for s in self.__strata]
+
+    @property
+    def transform_name(self) -> str:
+        """The transform name of the sweep."""
+        return self.__transform.value[0]
+
+    def info(self) -> str:
+        """String with the estimates of this sweep.
+
+        Returns:
+            str: The estimates, with their confidence intervals.
+        """
+        data = [
+            'Transform: %s' % self.__transform.value[0],
+            '\nBase: %d' % self.__base,
+            '\nx_0: [%d, %d]' % (self.__low, self.__high),
+            'Samples: %d%s' % (self.__n, '' if self.__converged else ' (not converged)'),
+            '\n\u03BC: %.4g [%.4g, %.4g]' % self.mu,
+            '\u03BB: %.4g [%.4g, %.4g]\n' % self.lambda_ ]
+
+        cycles = sorted(self.cycles.items(), key=lambda item: -item[1].value)
+
+        for cycle, estimate in cycles:
+            data.append('{%s}: %.4g [%.4g, %.4g]' % ((', '.join(map(str, cycle)),) + tuple(estimate)))
+
+        data.append('')
+
+        for mu, estimate in self.mu_distribution.items():
+            data.append('\u03BC = %d: %.4g [%.4g, %.4g]' % ((mu,) + tuple(estimate)))
+
+        data.append('')
+
+        for lambda_, estimate in self.lambda_distribution.items():
+            data.append('\u03BB = %d: %.4g [%.4g, %.4g]' % ((lambda_,) + tuple(estimate)))
+
+        return '\n'.join(data)
+
+    def __estimate(self, mean, variance) -> Estimate:
+        value = sum(s.weight * mean(s) for s in self.__strata)
+        error = math.sqrt(sum(s.weight ** 2 * variance(s) / s.n for s in self.__strata))
+        return Estimate(value, value - self.__z * error, value + self.__z * error)
+
+    def __proportion_variance(self, stratum: _Stratum, counts: Dict, key) -> float:
+        p = counts.get(key, 0) / stratum.n
+        return p * (1 - p) * stratum.n / (stratum.n - 1)
+
+    def __shares(self, counts, keys) -> Dict:
+        # The share of each key, with the stratum's counts of each given by `counts`.
+        shares = {}
+
+        for key in keys:
+            estimate = self.__estimate(lambda s: counts(s).get(key, 0) / s.n, lambda s: self.__proportion_variance(s, counts(s), key))
+            shares[key] = Estimate(estimate.value, max(0.0, estimate.low), min(1.0, estimate.high))
+
+        return shares
+
+    def __is_precise(self) -> bool:
+        if self.__n < self.__min_samples:
+            return False
+
+        for estimate in (self.mu, self.lambda_):
+            if estimate.half_width > self.__relative_precision * abs(estimate.value):
+                return False
+
+        for shares in (self.cycles, self.mu_distribution, self.lambda_distribution):
+            if any(estimate.half_width > self.__precision for estimate in shares.values()):
+                return False
+
+        return True
+
+    def __sample(self):
+        total = self.__high - self.__low + 1
+
+        # Plain ints, as an int minus a Natural is not reflected correctly.
+        for digits in range(len(self.__low), len(self.__high) + 1):
+            low = max(int(self.__low), 10 ** (digits - 1) if digits > 1 else 0)
+            high = min(int(self.__high), 10 ** digits - 1)
+            self.__strata.append(_Stratum(low, high, (high - low + 1) / total))
+
+        # Every stratum needs 2 samples for a variance, then each sample goes to
+        # the stratum furthest below its proportional share.
+        queue = [s for s in self.__strata for _ in range(2)]
+
+        while self.__n < self.__max_samples:
+            stratum = queue.pop() if queue else min(self.__strata, key=lambda s: s.n / s.weight)
+            self.__add(stratum, self.__random.randint(stratum.low, stratum.high))
+
+            if not queue and self.__n % 50 == 0 and self.__is_precise():
+                self.__converged = True
+                break
+
+    def __add(self, stratum: _Stratum, x_0: int):
+        sequence = TransformSequence(x_0, self.__base, self.__power, self.__transform, self.__max_mu, self.__tails)
+        cycle = tuple(sequence.cycle)
+
+        if cycle:
+            start = cycle.index(min(cycle))
+            cycle = cycle[start:] + cycle[:start]
+
+        stratum.add(cycle, sequence.mu, sequence.lambda_)
+        self.__n += 1
+
+        # Reservoir sampling keeps each sequence seen with the same probability.
+        seen = self.__seen[cycle] = self.__seen.get(cycle, 0) + 1
+        examples = self.__examples.setdefault(cycle, [])
+
+        if len(examples) < self.__n_examples:
+            examples.append(sequence)
+        else:
+            i = self.__random.randrange(seen)
+
+            if i < self.__n_examples:
+                examples[i] = sequence
@@ -1,14 +1,122 @@
 from jukebox._algae import ensure_integral_is_between, first, last
 from jukebox.natural import Natural
 from jukebox.transforms import Transform
-from typing import Callable, Final, Sequence, Tuple, Union
+from typing import Callable, Dict, Final, Hashable, Sequence, Tuple, Union
 
+import itertools
 import jukebox.transforms
+import threading
 
-__all__ = ['Transform', 'TransformSequence', 'TransformSequenceFactory', 'JSequence', 'JSequenceFactory',' KSequence', 'KSequenceFactory', 'BSequence, BSequenceFactory']
+__all__ = ['SharedTails', 'Transform', 'TransformSequence', 'TransformSequenceFactory', 'JSequence', 'JSequenceFactory',' KSequence', 'KSequenceFactory', 'BSequence, BSequenceFactory']
 
 DEFAULT_MAX_MU: Final[Natural] = Natural.of(500)
 
+class _Tail(object):
+    """A node of an orbit that ends in a cycle, shared by every sequence that reaches it.
+
+    A path node links to the next value. Every node holds the cycle the orbit
+    ends in, and the offset into it of the first cycle value reached.
+    """
+
+    __slots__ = ('value', 'next', 'mu', 'cycle', 'offset')
+
+    def __init__(self, value: Natural, next, mu: int, cycle: Tuple[Natural], offset: int):
+        self.value = value
+        self.next = next
+        self.mu = mu
+        self.cycle = cycle
+        self.offset = offset
+
+    def __iter__(self):
+        node = self
+
+        while node.mu > 0:
+            yield node.value
+            node = node.next
+
+        yield from self.cycle[self.offset:]
+        yield from self.cycle[:self.offset]
+
+class SharedTails(object):
+    """A hash-consed table of the orbits of sequences, by transform, base, and power.
+
+    Sequences built with the same table reference the nodes of a common tail,
+    instead of each holding a full copy of it. Only orbits that end in a cycle
+    are shared. The table is safe to share across threads. Nodes are added under
+    a lock, and a value already added by another thread is reused.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__orbits = {}
+
+    def __len__(self):
+        """The number of values in the table."""
+        return sum(map(len, list(self.__orbits.values())))
+
+    def _nodes(self, key: Hashable) -> Dict[Natural, _Tail]:
+        nodes = self.__orbits.get(key)
+
+        if nodes is None:
+            with self.__lock:
+                nodes = self.__orbits.setdefault(key, {})
+
+        return nodes
+
+    def _add(self, key: Hashable, path: Sequence[Natural], cycle: Sequence[Natural] = None, tail: _Tail = None) -> _Tail:
+        """Adds the `path` leading into either a new `cycle` or an existing `tail`, and returns the node of the first value."""
+        nodes = self._nodes(key)
+
+        with self.__lock:
+            if tail is None:
+                tail = nodes.get(cycle[0])
+
+                if tail is None:
+                    n_cycle = tuple(cycle)
+
+                    for offset, value in enumerate(n_cycle):
+                        nodes[value] = _Tail(value, None, 0, n_cycle, offset)
+
+                    tail = nodes[cycle[0]]
+
+            for value in reversed(path):
+                node = nodes.get(value)
+
+                if node is None:
+                    node = nodes[value] = _Tail(value, tail, tail.mu + 1, tail.cycle, tail.offset)
+
+                tail = node
+
+        return tail
+
+class _SharedTrack(Sequence):
+    """A read-only, tuple-like view of the values of a sequence, starting at a shared node."""
+
+    __slots__ = ('_head',)
+
+    def __init__(self, head: _Tail):
+        self._head = head
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(itertools.islice(self, *index.indices(len(self))))
+
+        n_index = index + len(self) if index < 0 else index
+
+        if n_index < 0 or n_index >= len(self):
+            raise IndexError('tuple index out of range')
+
+        if n_index >= self._head.mu:
+            return self._head.cycle[(self._head.offset + n_index - self._head.mu) % len(self._head.cycle)]
+
+        return next(itertools.islice(self, n_index, None))
+
+    def __iter__(self): return iter(self._head)
+
+    def __len__(self): return self._head.mu + len(self._head.cycle)
+
+    def __reversed__(self): return reversed(tuple(self))
+
 class TransformSequence(object):
     """Generic sequence starting with an initial value, base, and optional power.
 
@@ -16,14 +124,23 @@ class TransformSequence(object):
     transform until a cycle is reached, at which point it stops before the cycle
     repeats. If a cycle is never reached, it stops after the sequence has reached
     a given maximum length.
+
+    A sequence built with `SharedTails` does not hold its own tuple of values.
+    Indexing into its path walks the shared nodes, so it takes O(mu) rather than
+    O(1), and `full_sequence` builds a new tuple on every access. Iterate over
+    the sequence, or keep a copy of `full_sequence`, rather than indexing it in
+    a loop.
     """
 
-    def __init__(self, x_0: Natural, base: Natural, power: Natural = 1, transform: Transform = Transform.J, max_mu: Natural = DEFAULT_MAX_MU):
+    def __init__(self, x_0: Natural, base: Natural, power: Natural = 1, transform: Transform = Transform.J, max_mu: Natural = DEFAULT_MAX_MU, tails: SharedTails = None):
         """ Initializes a transform sequence starting with the `x_0` and `base` with optional `power`.
 
         The sequence is a result of subsequent applications of the J, K, B transforms,
         until a cycle or the maximum mu is reached.
 
+        If `tails` is given, the sequence stops at the first value already in it,
+        and references the shared tail from there instead of copying it.
+
         Raises:
             TypeError: If `transform` is not a `Transform` option.
         """
@@ -43,7 +160,7 @@ class TransformSequence(object):
         self.__power = Natural.of(power) if transform == Transform.B else (0 if transform == Transform.J else 1)
         self.__max_mu = Natural.of(max_mu)
 
-        self.__build()
+        self.__build(tails)
 
     @property
     def base(self) -> Natural:
@@ -58,7 +175,7 @@ class TransformSequence(object):
     @property
     def full_sequence(self) -> Tuple[Natural]:
         """The full sequence."""
-        return self.__track
+        return tuple(self.__track)
 
     @property
     def is_cyclic(self) -> bool:
@@ -171,25 +288,48 @@ class TransformSequence(object):
     def __len__(self): return len(self.__track)
 
     def __reversed__(self):
-        for i in range(len(self.__track)):
-            yield self.__track[-(i + 1)]
+        for value in reversed(self.__track):
+            yield value
 
-    def __build(self):
+    def __build(self, tails: SharedTails):
         track = []
         step = self.__x_0
         cycled = False
+        joined = None
         f = self.__transform.value[1]
-
-        if f == Transform.B:
-            while(not cycled) and (len(track) < self.__max_mu):
-                track.append(step)
-                step = f(step, self.__base, self.__power)
-                cycled = step in track
-        else:
-            while (not cycled) and (len(track) < self.__max_mu):
-                track.append(step)
-                step = f(step, self.__base)
-                cycled = step in track
+        args = (self.__base, self.__power) if self.__transform == Transform.B else (self.__base,)
+        key = (self.__transform, self.__base, self.__power)
+        nodes = tails._nodes(key) if tails is not None else {}
+        seen = set()
+
+        while (not cycled) and (len(track) < self.__max_mu):
+            joined = nodes.get(step)
+
+            if joined is not None:
+                break
+
+            track.append(step)
+            seen.add(step)
+            step = f(step, *args)
+            cycled = step in seen
+
+        if joined is not None and len(track) + len(joined.cycle) + joined.mu > self.__max_mu:
+            # The shared tail runs past the maximum mu, so the sequence is cut
+            # short without reaching its cycle.
+            track.extend(itertools.islice(joined, self.__max_mu - len(track)))
+        elif joined is not None or (cycled and tails is not None):
+            if joined is None:
+                mu = track.index(step)
+                head = tails._add(key, track[:mu], cycle=track[mu:])
+            else:
+                head = tails._add(key, track, tail=joined)
+
+            self.__mu = head.mu
+            self.__lambda = len(head.cycle)
+            self.__x_mu = head.cycle[head.offset]
+            self.__x_lambda = head.cycle[head.offset - 1]
+            self.__track = _SharedTrack(head)
+            return
 
         self.__mu = track.index(step) if cycled else len(track)
         self.__lambda = len(track) - self.__mu
@@ -203,17 +343,17 @@ class TransformSequence(object):
 class JSequence(TransformSequence):
     """The J_b(x) specific sequence."""
 
-    def __init__(self, initival_value: Natural, base: Natural, max_mu: Natural = DEFAULT_MAX_MU):
-        super().__init__(x_0, base, transform=Transform.J, max_mu=max_mu)
+    def __init__(self, x_0: Natural, base: Natural, max_mu: Natural = DEFAULT_MAX_MU, tails: SharedTails = None):
+        super().__init__(x_0, base, transform=Transform.J, max_mu=max_mu, tails=tails)
 
 class KSequence(TransformSequence):
     """The K_b(x) specific sequence."""
 
-    def __init__(self, x_0: Natural, base: Natural, max_mu: Natural = DEFAULT_MAX_MU):
-        super().__init__(x_0, base, transform=Transform.K, max_mu=max_mu)
+    def __init__(self, x_0: Natural, base: Natural, max_mu: Natural = DEFAULT_MAX_MU, tails: SharedTails = None):
+        super().__init__(x_0, base, transform=Transform.K, max_mu=max_mu, tails=tails)
 
 class BSequence(TransformSequence):
     """The B_b(x) specfic sequence."""
 
-    def __init__(self, x_0: Natural, base: Natural, power: Natural, max_mu: Natural = DEFAULT_MAX_MU):
-        super().__init__(x_0, base, power, transform=Transform.B, max_mu=max_mu)
+    def __init__(self, x_0: Natural, base: Natural, power: Natural, max_mu: Natural = DEFAULT_MAX_MU, tails: SharedTails = None):
+        super().__init__(x_0, base, power, transform=Transform.B, max_mu=max_mu, tails=tails)
@@ -1,11 +1,17 @@
+from jukebox.batches import batch_map
 from jukebox.natural import Natural
+from jukebox.transforms import Transform
+from typing import Iterable, List
 
-import transforms
+import jukebox.transforms as transforms
 
 __all__ = ['Transformer', 'JTransformer', 'KTransformer', 'BTransformer']
 
 class Transformer(object):
-    """ A wrapper of the transformers with a set base. """
+    """ A wrapper of the transformers with a set base.
+
+    The base is never changed, so a transformer can be shared across threads.
+    """
 
     def __init__(self, base: Natural):
         """ Initializes the based wrapper
@@ -15,14 +21,46 @@ class Transformer(object):
         """
         self.__base = Natural.of(base)
 
+    @property
+    def base(self) -> Natural:
+        """ The base for this transformer. """
+        return self.__base
+
     def J(self, value: Natural) -> Natural: return transforms.J(value, self.__base)
 
     def K(self, value: Natural) -> Natural: return transforms.K(value, self.__base)
 
     def B(self, value: Natural, power: Natural) -> Natural: return transforms.B(value, self.__base, power)
 
+    def batch(self, values: Iterable[Natural], transform: Transform, max_workers: int = None, parallel: bool = None, *, power: Natural = None) -> List[Natural]:
+        """ Transforms each value, in order, on a thread pool. See `jukebox.batches.batch_map`.
+
+        Raises:
+            TypeError: If `transform` is not a `Transform` option, or it is
+                `Transform.B` without a `power`.
+        """
+        if not isinstance(transform, Transform):
+            raise TypeError(':[%s]: Input is not a valid `Transform` option. Options are `Transform.J`, `Transform.K`, or `Transform.B`.' % str(transform))
+
+        base = self.__base
+
+        if transform == Transform.B:
+            if power is None:
+                raise TypeError(':[None]: A `Transform.B` batch requires a power.')
+
+            n_power = Natural.of(power)
+            return batch_map(lambda value: transforms.B(value, base, n_power), values, max_workers, parallel)
+
+        f = transform.value[1]
+        return batch_map(lambda value: f(value, base), values, max_workers, parallel)
+
 class JTransformer(object):
-    """ A wrapper of the J_b(x) transformer with a set base. """
+    """ A wrapper of the J_b(x) transformer with a set base.
+
+    A transformer is safe to share across threads. `rebase` replaces the base in
+    a single assignment, and each call reads the base once, so a call running
+    alongside `rebase` uses either the old or the new base.
+    """
 
     def __init__(self, base: Natural):
         """ Initializes the based wrapper
@@ -37,14 +75,22 @@ class JTransformer(object):
         """ The base for this transformer. """
         return self.__base
 
-    def rebase(base: Natural):
+    def rebase(self, base: Natural):
         """ Changes the base for this transformer. """
         self.__base = Natural.of(base)
 
+    def batch(self, values: Iterable[Natural], max_workers: int = None, parallel: bool = None) -> List[Natural]:
+        """ Transforms each value, in order, on a thread pool. See `jukebox.batches.batch_map`. """
+        base = self.__base
+        return batch_map(lambda value: transforms.J(value, base), values, max_workers, parallel)
+
     def __call__(self, value: Natural) -> Natural: return transforms.J(value, self.__base)
 
 class KTransformer(object):
-    """ A wrapper of the J_b(x) transformer with a set base. """
+    """ A wrapper of the K_b(x) transformer with a set base.
+
+    Like `JTransformer`, it is safe to share across threads.
+    """
 
     def __init__(self, base: Natural):
         """ Initializes the based wrapper
@@ -59,14 +105,23 @@ class KTransformer(object):
         """ The base for this transformer. """
         return self.__base
 
-    def rebase(base: Natural):
+    def rebase(self, base: Natural):
         """ Changes the base for this transformer. """
         self.__base = Natural.of(base)
 
+    def batch(self, values: Iterable[Natural], max_workers: int = None, parallel: bool = None) -> List[Natural]:
+        """ Transforms each value, in order, on a thread pool. See `jukebox.batches.batch_map`. """
+        base = self.__base
+        return batch_map(lambda value: transforms.K(value, base), values, max_workers, parallel)
+
     def __call__(self, value: Natural) -> Natural: return transforms.K(value, self.__base)
 
-class BasedBTransformer(object):
-    """ A wrapper of the J_b(x) transformer with a set base. """
+class BTransformer(object):
+    """ A wrapper of the B_b(x) transformer with a set base.
+
+    Like `JTransformer`, it is safe to share across threads. The power is fixed,
+    so only the base can change between calls.
+    """
 
     def __init__(self, base: Natural, power: Natural = 1):
         """ Initializes the based wrapper
@@ -88,8 +143,14 @@ class BasedBTransformer(object):
         """The power for this transformer."""
         return self.__power
 
-    def rebase(base: Natural):
+    def rebase(self, base: Natural):
         """ Changes the base for this transformer. """
         self.__base = Natural.of(base)
 
-    def __call__(self, value: Natural, power: int = -1) -> Natural: return transforms.B(value, base (self.__power if power is None or power < 0 else power))
+    def batch(self, values: Iterable[Natural], max_workers: int = None, parallel: bool = None, *, power: int = -1) -> List[Natural]:
+        """ Transforms each value, in order, on a thread pool. See `jukebox.batches.batch_map`. """
+        base = self.__base
+        n_power = self.__power if power is None or power < 0 else power
+        return batch_map(lambda value: transforms.B(value, base, n_power), values, max_workers, parallel)
+
+    def __call__(self, value: Natural, power: int = -1) -> Natural: return transforms.B(value, self.__base, self.__power if power is None or power < 0 else power)